@@ -6,8 +6,9 @@ from abc import abstractmethod
 from types import MappingProxyType
 from contextvars import ContextVar
 from typing import (Union, Tuple, Callable, Any, Sequence, Iterator, ClassVar, 
-    List, OrderedDict, Generic, TypeVar)
+    List, OrderedDict, Generic, TypeVar, Optional)
 from functools import partial
+from operator import is_
 import logging
 
 from .processes import Process
@@ -90,6 +91,8 @@ class Module(Construct, Generic[P]):
 
     _process: P
     _inputs: List[Tuple[str, Callable]]
+    _asks: Tuple[Callable, ...]
+    _last: Optional[Tuple[nd.NumDict, ...]]
     _i_uris: Tuple[str, ...]
     _fs_uris: Tuple[str, ...]
 
@@ -111,6 +114,8 @@ class Module(Construct, Generic[P]):
 
         super().__init__(name=name)
         self._inputs = []
+        self._asks = ()
+        self._last = None
         self._i_uris = tuple(i_uris)
         self._fs_uris = tuple(fs_uris)
         self.process = process
@@ -133,6 +138,7 @@ class Module(Construct, Generic[P]):
     @process.setter
     def process(self, process: P) -> None:
         self._process = process
+        self._last = None
         process.prefix = uris.split_head(self.path.lstrip(uris.SEP))[1]
 
     @property 
@@ -142,7 +148,12 @@ class Module(Construct, Generic[P]):
 
     def step(self) -> None:
         try:
-            self.output = self.process.call(*self._pull())
+            inputs = self._pull()
+            if not self.process.memoize:
+                self.output = self.process.call(*inputs)
+            elif not self._unchanged(inputs):
+                self.output = self.process.call(*inputs)
+                self._last = inputs
         except Exception as e:
             raise RuntimeError(f"Error in process "
             f"{type(self.process).__name__} of module '{self.path}'") from e
@@ -163,6 +174,7 @@ class Module(Construct, Generic[P]):
                 raise RuntimeError("Unexpected strength constant.")
             output.prot = True
         self._output = output
+        self._last = None
 
     def clear_output(self) -> None:
         """Set output to initial state."""
@@ -174,9 +186,17 @@ class Module(Construct, Generic[P]):
     def _link(self, path: str, callback: Callable) -> None:
         logging.debug(f"Connecting '{path}' to '{self.path}'")
         self._inputs.append((path, callback))
+        self._asks += (callback,)
 
     def _pull(self) -> Tuple[nd.NumDict, ...]:
-        return tuple(ask() for _, ask in self._inputs)
+        return tuple([ask() for ask in self._asks])
+
+    def _unchanged(self, inputs: Tuple[nd.NumDict, ...]) -> bool:
+        # Identity implies equality only for protected inputs; outputs may 
+        # be left unprotected (e.g., by GradientTape.gradients()).
+        last = self._last
+        return (last is not None and all(map(is_, inputs, last)) 
+            and all(d.prot for d in inputs))
 
         
 class Structure(Construct):
@@ -289,10 +309,11 @@ class Structure(Construct):
                     raise TypeError(f"Expected Module instance at '{path}', "
                         f"got '{type(obj).__name__}' instead.")
                 else:
-                    view = partial(type(obj).output.fget, obj) # type: ignore
                     if frag:
-                        module._link(ref, lambda v=view, i=int(frag): v()[i])
+                        module._link(ref, lambda o=obj, i=int(frag): 
+                            o.output[i])
                     else:
+                        view = partial(type(obj).output.fget, obj) # type: ignore
                         module._link(ref, view) 
 
     def _set_fspaces(self, module: Module) -> None:
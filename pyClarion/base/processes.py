@@ -16,6 +16,10 @@ class Process:
 
     fspace_names: ClassVar = ("reprs", "cmds", "params", "flags")
 
+    # Set to True in processes whose outputs depend only on their inputs. 
+    # Modules skip calls to such processes when inputs are unchanged.
+    memoize: ClassVar[bool] = False
+
     prefix: str = ""
     fspaces: Tuple[partial[Tuple[feature, ...]], ...] = ()
 
@@ -0,0 +1,164 @@
+"""Numerical kernels for propagating activations through compiled rules."""
+
+
+__all__ = ["compute_strengths", "changed_rules", "update_strengths", 
+    "reduce_max_by_conc"]
+
+
+from typing import (Dict, Iterable, List, Mapping, Optional, Sequence, Set, 
+    Tuple, TypeVar)
+from itertools import repeat
+from operator import mul
+
+
+C = TypeVar("C")
+K = TypeVar("K")
+
+
+def compute_strengths(
+    m: Mapping[C, float],
+    conds: Sequence[Tuple[C, ...]],
+    weights: Sequence[Tuple[float, ...]],
+    by_cond: Mapping[C, Tuple[int, ...]],
+    caps: Optional[Sequence[float]] = None,
+    epsilon: float = 0.0
+) -> List[float]:
+    """
+    Return the weighted condition sum of each rule.
+
+    Only rules with at least one condition of nonzero strength are evaluated;
+    all other rules have zero strength.
+
+    :param m: Condition strengths. Absent conditions have zero strength.
+    :param conds: Condition keys of each rule.
+    :param weights: Condition weights of each rule, aligned with conds.
+    :param by_cond: Inverted index from condition keys to rule indices.
+    :param caps: Sum of absolute condition weights of each rule. Required 
+        for culling.
+    :param epsilon: Rules with absolute strength not exceeding epsilon are 
+        assigned zero strength. 
+    """
+
+    active = set()
+    for c, v in m.items():
+        if v != 0.0 and c in by_cond:
+            active.update(by_cond[c])
+
+    # Weighted sums are computed with map() to keep the inner loop in C.
+    # Evaluation is deliberately serial: the work holds the GIL, so
+    # spreading rules over a thread pool only adds scheduling overhead.
+    strengths = [0.0] * len(conds)
+    _evaluate(m, strengths, active, conds, weights, caps, epsilon)
+    return strengths
+
+
+def changed_rules(
+    m: Mapping[C, float],
+    last: Mapping[C, float],
+    by_cond: Mapping[C, Tuple[int, ...]]
+) -> Set[int]:
+    """
+    Return indices of rules with a condition whose strength differs in m and 
+    last.
+
+    :param m: Current condition strengths.
+    :param last: Previous condition strengths.
+    :param by_cond: Inverted index from condition keys to rule indices.
+    """
+
+    changed = set()
+    for c, v in m.items():
+        if v != last.get(c, 0.0) and c in by_cond:
+            changed.update(by_cond[c])
+    for c, v in last.items():
+        if v != 0.0 and c not in m and c in by_cond:
+            changed.update(by_cond[c])
+    return changed
+
+
+def update_strengths(
+    m: Mapping[C, float],
+    strengths: List[float],
+    indices: Iterable[int],
+    conds: Sequence[Tuple[C, ...]],
+    weights: Sequence[Tuple[float, ...]],
+    caps: Optional[Sequence[float]] = None,
+    epsilon: float = 0.0
+) -> None:
+    """
+    Recompute the strengths of selected rules in place.
+
+    Each rule is recomputed in full rather than adjusted by a delta, so 
+    results match those of compute_strengths() exactly.
+
+    :param m: Condition strengths. Absent conditions have zero strength.
+    :param strengths: Rule strengths; updated in place.
+    :param indices: Indices of rules to recompute.
+    :param conds: Condition keys of each rule.
+    :param weights: Condition weights of each rule, aligned with conds.
+    :param caps: As in compute_strengths().
+    :param epsilon: As in compute_strengths().
+    """
+
+    _evaluate(m, strengths, indices, conds, weights, caps, epsilon)
+
+
+def _evaluate(
+    m: Mapping[C, float],
+    strengths: List[float],
+    indices: Iterable[int],
+    conds: Sequence[Tuple[C, ...]],
+    weights: Sequence[Tuple[float, ...]],
+    caps: Optional[Sequence[float]],
+    epsilon: float
+) -> None:
+
+    get, zeros = m.get, repeat(0.0)
+    if epsilon <= 0.0:
+        for i in indices:
+            strengths[i] = sum(map(mul, weights[i], map(get, conds[i], zeros)))
+        return
+
+    # A rule's strength is bounded by caps[i] * max(|m|), so rules whose 
+    # bound does not exceed epsilon are culled without reading conditions.
+    dmax = max(map(abs, m.values()), default=0.0)
+    for i in indices:
+        if caps is not None and caps[i] * dmax <= epsilon:
+            strengths[i] = 0.0
+            continue
+        s = sum(map(mul, weights[i], map(get, conds[i], zeros)))
+        strengths[i] = s if epsilon < abs(s) else 0.0
+
+
+def reduce_max_by_conc(
+    strengths: Sequence[float],
+    by_conc: Mapping[K, Tuple[Tuple[int, float], ...]],
+    keys: Optional[Iterable[K]] = None
+) -> Dict[K, float]:
+    """
+    Return the max weighted rule strength for each conclusion.
+
+    Rules with zero strength do not contribute, and conclusions with zero
+    strength are omitted from the result.
+
+    :param strengths: Rule strengths, indexed by rule.
+    :param by_conc: Mapping from conclusion keys to (rule index, weight)
+        links.
+    :param keys: Optional iterable of conclusion keys. If given, only these 
+        conclusions are reduced.
+    """
+
+    result: Dict[K, float] = {}
+    items = (by_conc.items() if keys is None 
+        else ((k, by_conc[k]) for k in keys))
+    for k, links in items:
+        best: Optional[float] = None
+        for i, w in links:
+            s = strengths[i]
+            if s != 0.0:
+                v = w * s
+                if best is None or best < v:
+                    best = v
+        if best is not None and best != 0.0:
+            result[k] = best
+    return result
@@ -8,11 +8,16 @@ __all__ = ["Repeat", "Actions", "CAM", "Shift", "BoltzmannSampler",
 from ..base import dimension, feature, chunk, rule
 from .. import numdicts as nd
 from .. import dev as cld
+from ._rules_kernels import (compute_strengths, changed_rules, 
+    update_strengths, reduce_max_by_conc)
 
 import re
 from typing import (OrderedDict, Tuple, Dict, List, TypeVar, Union, Sequence, 
-    Generator)
+    Generator, Optional, NamedTuple, ClassVar)
 from functools import partial
+from math import exp
+from random import choices
+from weakref import WeakValueDictionary
 
 
 T = TypeVar("T")
@@ -22,6 +27,7 @@ class Repeat(cld.Process):
     """Copies signal from a single source."""
 
     initial = nd.NumDict()
+    memoize = True
 
     def call(self, d: nd.NumDict[T]) -> nd.NumDict[T]:
         return d
@@ -161,6 +167,7 @@ class CAM(cld.Process):
     """Computes the combined-add-max activation for each node in a pool."""
 
     initial = nd.NumDict()
+    memoize = True
 
     def call(self, *inputs: nd.NumDict[T]) -> nd.NumDict[T]:
         return nd.NumDict.eltwise_cam(*inputs)
@@ -170,6 +177,7 @@ class Shift(cld.Process):
     """Shifts feature strengths by one time step."""
 
     initial = nd.NumDict()
+    memoize = True
 
     def __init__(
         self, lead: bool = False, max_lag: int = 1, min_lag: int = 0
@@ -212,9 +220,10 @@ class BoltzmannSampler(cld.Process):
         """
 
         # assuming d.c == 0
-        _d = d.keep_greater(ref=p.isolate(key=self.params[0]))
+        th, temp = self.params
+        _d = d.keep_greater(ref=p.isolate(key=th))
         if len(_d):
-            dist = _d.boltzmann(p.isolate(key=self.params[1]))
+            dist = _d.boltzmann(p.isolate(key=temp))
             return dist.sample().squeeze(), dist
         else:
             return self.initial
@@ -282,6 +291,7 @@ class BottomUp(cld.Process):
     """Propagates bottom-up activations."""
 
     initial = nd.NumDict()
+    memoize = True
 
     def call(
         self, 
@@ -313,6 +323,7 @@ class TopDown(cld.Process):
     """Propagates top-down activations."""
 
     initial = nd.NumDict()
+    memoize = True
 
     def call(
         self, 
@@ -335,10 +346,199 @@ class TopDown(cld.Process):
             .squeeze())
 
 
-class AssociativeRules(cld.Process):
+class _Rules:
+    """
+    A compiled view of rule weights.
+
+    Lays out chunk-rule associations as parallel sequences indexed by rule so 
+    that rule strengths may be computed in a single pass over the data. 
+    
+    Conclusion associations are stored per rule as (chunk, weight) pairs, 
+    kept in the order in which they appear in rc. They are also grouped by 
+    conclusion chunk as (rule index, weight) pairs, so that max-by-conclusion 
+    reductions visit each conclusion once. Rules lacking conditions never 
+    fire, so their conclusions are omitted.
+
+    An inverted index from condition chunks to rules allows strengths to be 
+    computed only for rules with at least one active condition.
+
+    Instances are read-only; a new view should be compiled whenever the source 
+    weights change. Use _compile_rules() to obtain views, so that propagators 
+    fed by the same rule weights share a single view.
+    """
+
+    __slots__ = ("cr", "rc", "rules", "conds", "weights", "by_cond", "concs", 
+        "by_conc", "caps", "__weakref__")
+
+    cr: nd.NumDict[Tuple[chunk, rule]]
+    rc: nd.NumDict[Tuple[rule, chunk]]
+    rules: List[rule]
+    conds: List[Tuple[chunk, ...]]
+    weights: List[Tuple[float, ...]]
+    by_cond: Dict[chunk, Tuple[int, ...]]
+    concs: List[Tuple[Tuple[chunk, float], ...]]
+    by_conc: Dict[chunk, Tuple[Tuple[int, float], ...]]
+    caps: List[float]
+
+    def __init__(
+        self, 
+        cr: nd.NumDict[Tuple[chunk, rule]], 
+        rc: nd.NumDict[Tuple[rule, chunk]], 
+        normalize: bool = False
+    ) -> None:
+        """
+        Compile a new view of rule weights.
+
+        :param cr: Chunk-to-rule associations (i.e., condition weights).
+        :param rc: Rule-to-chunk associations (i.e., conclusion weights).
+        :param normalize: If True, each condition weight is divided by the 
+            sum of absolute weights associated with its chunk.
+        """
+
+        self.cr, self.rc = cr, rc
+        norm = cr.abs().sum_by(kf=cld.first) if normalize else None
+
+        index: Dict[rule, int] = {}
+        conds: List[List[chunk]] = []
+        weights: List[List[float]] = []
+        for (c, r), w in cr.items():
+            i = index.setdefault(r, len(index))
+            if i == len(conds):
+                conds.append([]); weights.append([])
+            conds[i].append(c)
+            weights[i].append(w / norm[c] if norm is not None else w)
+        self.rules = list(index)
+        self.conds = [tuple(cs) for cs in conds]
+        self.weights = [tuple(ws) for ws in weights]
+        self.caps = [sum(map(abs, ws)) for ws in self.weights]
+
+        by_cond: Dict[chunk, List[int]] = {}
+        for i, cs in enumerate(self.conds):
+            for c in cs:
+                by_cond.setdefault(c, []).append(i)
+        self.by_cond = {c: tuple(idx) for c, idx in by_cond.items()}
+
+        concs: List[List[Tuple[chunk, float]]] = [[] for _ in self.rules]
+        by_conc: Dict[chunk, List[Tuple[int, float]]] = {}
+        for (r, c), w in rc.items():
+            if r not in index:
+                continue
+            i = index[r]
+            concs[i].append((c, w))
+            by_conc.setdefault(c, []).append((i, w))
+        self.concs = [tuple(cs) for cs in concs]
+        self.by_conc = {c: tuple(links) for c, links in by_conc.items()}
+
+    def compiled_from(
+        self, 
+        cr: nd.NumDict[Tuple[chunk, rule]], 
+        rc: nd.NumDict[Tuple[rule, chunk]]
+    ) -> bool:
+        """
+        Return True iff self is a valid view of cr and rc.
+        
+        Views are only reused for protected sources, as other NumDicts may be 
+        mutated in place.
+        """
+        return self.cr is cr and self.rc is rc and cr.prot and rc.prot
+
+    def strengths(self, d: nd.NumDict[chunk]) -> List[float]:
+        """
+        Return the strength of each rule given condition chunk strengths d.
+        
+        Chunks absent from d are treated as having zero strength. Only rules 
+        with at least one condition of nonzero strength are evaluated.
+        """
+
+        return compute_strengths(d.view, self.conds, self.weights, 
+            self.by_cond)
+
+
+_COMPILED: "WeakValueDictionary[Tuple[int, int, bool], _Rules]" = \
+    WeakValueDictionary()
+
+
+def _compile_rules(
+    cr: nd.NumDict[Tuple[chunk, rule]], 
+    rc: nd.NumDict[Tuple[rule, chunk]], 
+    normalize: bool = False
+) -> _Rules:
+    """
+    Return a compiled view of rule weights cr and rc.
+
+    Views of protected weights are hash-consed: while a view is alive, requests 
+    for the same cr, rc and normalize return that very view. 
+    """
+
+    # Ids are safe keys, as a live view holds references to cr and rc.
+    key = (id(cr), id(rc), normalize)
+    rules = _COMPILED.get(key)
+    if rules is None or not rules.compiled_from(cr, rc):
+        rules = _Rules(cr, rc, normalize=normalize)
+        if cr.prot and rc.prot:
+            _COMPILED[key] = rules
+    return rules
+
+
+class _RuleProcess(cld.Process):
+    """Base for processes propagating through compiled rule weights."""
+
+    _normalize: ClassVar[bool] = False
+    _rules: Optional[_Rules] = None
+
+    def _compile(
+        self, 
+        cr: nd.NumDict[Tuple[chunk, rule]], 
+        rc: nd.NumDict[Tuple[rule, chunk]]
+    ) -> _Rules:
+        if self._rules is None or not self._rules.compiled_from(cr, rc):
+            self._rules = _compile_rules(cr, rc, normalize=self._normalize)
+        return self._rules
+
+
+class _DeltaState(NamedTuple):
+    """Propagation state carried between AssociativeRules calls."""
+    rules: _Rules
+    m: Dict[chunk, float] # condition strengths
+    strengths: List[float] # rule strengths, indexed as in rules
+    s_r: Dict[rule, float]
+    s_c: Dict[chunk, float]
+
+
+class AssociativeRules(_RuleProcess):
     """Propagates activations according to associative rules."""
 
     initial = (nd.NumDict(), nd.NumDict())
+    memoize = True
+    # Only selects between delta and full propagation, which give identical 
+    # results, so cached state stays valid if this is changed.
+    _delta_limit = 0.125
+
+    _normalize = True
+    _memo: Optional[Tuple[_Rules, nd.NumDict[chunk], 
+        Tuple[nd.NumDict[chunk], nd.NumDict[rule]]]] = None
+    _state: Optional[_DeltaState] = None
+
+    def __init__(self, epsilon: float = 0.0) -> None:
+        """
+        Initialize a new `AssociativeRules` propagator.
+
+        :param epsilon: Rules with absolute strength not exceeding epsilon 
+            are treated as inactive. Rules whose strength cannot exceed 
+            epsilon given current condition strengths are culled without 
+            being evaluated.
+        """
+
+        self._epsilon = float(epsilon)
+
+    @property
+    def epsilon(self) -> float:
+        """
+        Strength threshold for rule activation. 
+        
+        Read-only, as cached outputs and rule strengths depend on it.
+        """
+        return self._epsilon
 
     def call(
         self, 
@@ -348,6 +548,12 @@ class AssociativeRules(cld.Process):
     ) -> Tuple[nd.NumDict[chunk], nd.NumDict[rule]]:
         """
         Propagate activations through associative rules.
+
+        If rule weights are unchanged and d is protected and equal to the 
+        condition strengths of the previous call, the previous (protected) 
+        outputs are returned as is. Otherwise, if rule weights are unchanged, 
+        only rules with a condition whose strength changed since the previous 
+        call are reevaluated.
         
         :param cr: Chunk-to-rule associations (i.e., condition weights).
         :param rc: Rule-to-chunk associations (i.e., conclusion weights; 
@@ -355,23 +561,55 @@ class AssociativeRules(cld.Process):
         :param d: Condition chunk strengths.
         """
 
-        norm = (cr
-            .put(cr.abs().sum_by(kf=cld.first), kf=cld.first)
-            .set_c(1))
-        s_r = (cr
-            .mul_from(d, kf=cld.first, strict=True)
-            .div(norm)
-            .sum_by(kf=cld.second)
-            .squeeze())
-        s_c = (rc
-            .mul_from(s_r, kf=cld.first, strict=True)
-            .max_by(kf=cld.second)
-            .squeeze())
+        rules = self._compile(cr, rc)
+        memo = self._memo
+        if (memo is not None and memo[0] is rules and d.prot 
+            and (memo[1] is d or memo[1] == d)):
+            return memo[2]
 
-        return s_c, s_r
+        result = self._propagate(rules, d)
+        self._memo = (rules, d, result) if d.prot else None
+        return result
 
+    def _propagate(
+        self, rules: _Rules, d: nd.NumDict[chunk]
+    ) -> Tuple[nd.NumDict[chunk], nd.NumDict[rule]]:
+
+        m = d.m # snapshot, kept in state for the next call
+        state = self._state
+        changed = None
+        if state is not None and state.rules is rules:
+            changed = changed_rules(m, state.m, rules.by_cond)
+            # Past a modest fraction of rules, the bookkeeping costs more 
+            # than it saves.
+            if self._delta_limit * len(rules.rules) < len(changed):
+                changed = None
+        if state is None or changed is None:
+            strengths = compute_strengths(m, rules.conds, rules.weights, 
+                rules.by_cond, rules.caps, self._epsilon)
+            s_r = {r: s for r, s in zip(rules.rules, strengths) if s != 0.0}
+            s_c = reduce_max_by_conc(strengths, rules.by_conc)
+        else:
+            strengths, s_r, s_c = state.strengths, state.s_r, state.s_c
+            update_strengths(m, strengths, changed, rules.conds, 
+                rules.weights, rules.caps, self._epsilon)
+            touched: Dict[chunk, None] = {}
+            for i in sorted(changed):
+                r, s = rules.rules[i], strengths[i]
+                if s != 0.0:
+                    s_r[r] = s
+                else:
+                    s_r.pop(r, None)
+                touched.update(dict.fromkeys(c for c, _ in rules.concs[i]))
+            for c in touched:
+                s_c.pop(c, None)
+            s_c.update(reduce_max_by_conc(strengths, rules.by_conc, touched))
+        self._state = _DeltaState(rules, m, strengths, s_r, s_c)
 
-class ActionRules(cld.Process):
+        return nd.NumDict(s_c, prot=True), nd.NumDict(s_r, prot=True)
+
+
+class ActionRules(_RuleProcess):
     """Selects action chunks according to action rules."""
 
     initial = (nd.NumDict(), nd.NumDict(), nd.NumDict())
@@ -395,20 +633,39 @@ class ActionRules(cld.Process):
         """
 
         # assuming d.c == 0
-        _d = d.keep_greater(ref=p.isolate(key=self.params[0]))
+        th, temp = self.params
+        _d = d.keep_greater(ref=p.isolate(key=th))
         if len(_d) and len(cr):
-            dist = (cr
-                .mul_from(_d, kf=cld.first)
-                .boltzmann(p.isolate(key=self.params[1]))
-                .transform_keys(kf=cld.second)
-                .squeeze())
-            r_sampled = rc.put(dist.sample().squeeze(), kf=cld.first)
-            r_data = r_sampled.transform_keys(kf=cld.first).squeeze()
-            action = r_sampled.mul(rc).transform_keys(kf=cld.second).squeeze()
-            return action, r_data, dist
+            rules = self._compile(cr, rc)
+            i, probs = self._select(rules.strengths(_d), p[temp])
+            dist = {r: v for r, v in zip(rules.rules, probs) if v != 0.0}
+            concs = rules.concs[i]
+            action = {c: w for c, w in concs if w != 0.0}
+            r_data = {rules.rules[i]: 1.0} if concs else {}
+            return nd.NumDict(action), nd.NumDict(r_data), nd.NumDict(dist)
         else:
             return self.initial
 
+    @staticmethod
+    def _select(
+        strengths: List[float], temp: float
+    ) -> Tuple[int, List[float]]:
+        """
+        Sample an index according to a Boltzmann distribution over strengths.
+
+        Fuses boltzmann and sample ops: the draw is made directly from 
+        unnormalized weights, which are normalized once for reporting.
+
+        :returns: tuple (index, probabilities)
+        """
+
+        # s - vmax is a stability trick; softmax(x) = softmax(x + c)
+        vmax = max(strengths)
+        ws = [exp((s - vmax) / temp) for s in strengths]
+        i, = choices(range(len(ws)), weights=ws)
+        total = sum(ws)
+        return i, [w / total for w in ws]
+
     @property
     def params(self) -> Tuple[feature, ...]:
         return tuple(feature(dim) 
@@ -120,6 +120,10 @@ class Store(Process):
     cb: Optional[BLATracker[chunk]]
     rb: Optional[BLATracker[rule]]
 
+    _empty = nd.NumDict(prot=True)
+    _wn_cache: Optional[Tuple[nd.NumDict[chunk], Callable, 
+        nd.NumDict[chunk]]] = None
+
     # parameter prefixes for cb and rb
     c_pre = "c"
     r_pre = "r"
@@ -156,22 +160,32 @@ class Store(Process):
         nd.NumDict[rule]]:
 
         cb, rb = self.update_blas(p, c, r)
-        wn = self.g(self.wn).set_c(0)
-        return self.cf, self.cw, wn, self.cr, self.rc, cb, rb
+        return self.cf, self.cw, self._g_wn(), self.cr, self.rc, cb, rb
+
+    def _g_wn(self) -> nd.NumDict[chunk]:
+        # Rebuilt only when wn or g is reassigned, so that downstream modules 
+        # see identical inputs across steps. wn is protected once read, like 
+        # the other weight outputs, so it cannot change in place.
+        cache = self._wn_cache
+        if cache is None or cache[0] is not self.wn or cache[1] is not self.g:
+            self.wn.prot = True
+            cache = (self.wn, self.g, self.g(self.wn).set_c(0))
+            self._wn_cache = cache
+        return cache[2]
 
     def update_blas(
         self, p: nd.NumDict[feature], c: nd.NumDict[chunk], r: nd.NumDict[rule]
     ) -> Tuple[nd.NumDict[chunk], nd.NumDict[rule]]:
 
         if self.cb is None: 
-            cb = nd.NumDict()
+            cb = self._empty
         else: 
             cp = self._extract_cp(p)
             self.cb.update(cp, c)
             cb = self.cb.call(cp)
 
         if self.rb is None: 
-            rb = nd.NumDict()
+            rb = self._empty
         else: 
             rp = self._extract_rp(p)
             self.rb.update(rp, r)
@@ -180,42 +194,22 @@ class Store(Process):
         return cb, rb
 
     def _extract_cp(self, p: nd.NumDict):
-        return (p
-            .keep(sf=self._select_cps)
-            .transform_keys(kf=self._transform_cps))
-
-    def _extract_rp(self, p: nd.NumDict):
-        return (p
-            .keep(sf=self._select_rps)
-            .transform_keys(kf=self._transform_rps))
-
-    def _select_cps(self, k):
-        if self.cb is not None:
-            return k in self.params[0:len(self.cb.params)]
-        else:
-            raise ValueError("Chunk BLAs not defined")
-
-    def _transform_cps(self, k):
         if self.cb is None:
             raise ValueError("Chunk BLAs not defined")
-        else:
-            params = self.params[0:len(self.cb.params)]
-            return self.cb.params[params.index(k)]
+        return self._extract(p, 0, self.cb.params)
 
-    def _select_rps(self, k):
+    def _extract_rp(self, p: nd.NumDict):
         if self.rb is None:
             raise ValueError("Rule BLAs not defined")
-        else:
-            offset = 0 if self.cb is None else len(self.cb.params)
-            return k in self.params[offset:offset + len(self.rb.params)]
+        offset = 0 if self.cb is None else len(self.cb.params)
+        return self._extract(p, offset, self.rb.params)
 
-    def _transform_rps(self, k):
-        if self.rb is None:
-            raise ValueError("Rule BLAs not defined")
-        else:
-            offset = 0 if self.cb is None else len(self.cb.params)
-            params = self.params[offset:offset + len(self.rb.params)]
-            return self.rb.params[params.index(k)]
+    def _extract(self, p: nd.NumDict, offset: int, names: Tuple[str, ...]):
+        # Params are computed once per call, not once per key of p.
+        params = self.params[offset:offset + len(names)]
+        return (p
+            .keep(sf=params.__contains__)
+            .transform_keys(kf=dict(zip(params, names)).__getitem__))
 
     @property
     def params(self):
@@ -173,7 +173,7 @@ def merge(*ds: nd.NumDict[T]) -> nd.NumDict[T]:
         raise ValueError("Merge must be provided with at least one argument.")
     d = nd.NumDict[T]._new(c=0.0)
     for _d in ds: 
-        d.update({k: v for k, v in _d.items()}, strict=True)
+        d.update(_d, strict=True)
     return d
 
 @gt.GradientTape.grad(merge)
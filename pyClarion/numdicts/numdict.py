@@ -8,9 +8,11 @@ from . import dict_ops as dops
 from . import vec_ops as vops
 from . import nn_ops
 
-from typing import Callable, Dict, Mapping, TypeVar, Iterator, Any, Optional
+from typing import (Callable, Dict, Mapping, TypeVar, Iterator, Any, Optional, 
+    KeysView, ValuesView, ItemsView)
 from typing_extensions import Concatenate, ParamSpec
 from functools import wraps
+from types import MappingProxyType
 from math import isnan, isinf
 
 
@@ -59,7 +61,10 @@ class NumDict(Mapping[T, float]):
         c: Any = 0.0, 
         prot: bool = False
     ) -> None:
-        self._m = {k: float(v) for k, v in m.items()} if m else {}
+        if isinstance(m, NumDict):
+            self._m = m._m.copy() # values already floats
+        else:
+            self._m = {k: float(v) for k, v in m.items()} if m else {}
         self._c = float(c) 
         self._prot = prot
 
@@ -81,6 +86,11 @@ class NumDict(Mapping[T, float]):
     def m(self) -> Dict[T, float]:
         return self._m.copy()
 
+    @property
+    def view(self) -> Mapping[T, float]:
+        """Read-only view of explicitly set key-value pairs (not a copy)."""
+        return MappingProxyType(self._m)
+
     @property
     def c(self) -> float:
         """The NumDict constant."""
@@ -117,7 +127,19 @@ class NumDict(Mapping[T, float]):
         return len(self._m)
 
     def __iter__(self) -> Iterator[T]:
-        yield from iter(self._m)
+        return iter(self._m)
+
+    # Views of the underlying dict are read-only and avoid the per-item 
+    # __getitem__ calls of the generic Mapping views.
+
+    def keys(self) -> KeysView[T]:
+        return self._m.keys()
+
+    def values(self) -> ValuesView[float]:
+        return self._m.values()
+
+    def items(self) -> ItemsView[T, float]:
+        return self._m.items()
 
     def __contains__(self, key: Any) -> bool:
         return key in self._m
@@ -157,7 +179,10 @@ class NumDict(Mapping[T, float]):
         """
         if clear: self.clear()
         n_old = len(self)
-        self._m.update({k: float(v) for k, v in m.items()})
+        if isinstance(m, NumDict):
+            self._m.update(m._m) # values already floats
+        else:
+            self._m.update({k: float(v) for k, v in m.items()})
         if strict and len(self._m) < n_old + len(m): 
             raise ValueError("Arg m not disjoint with self")
 
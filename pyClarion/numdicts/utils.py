@@ -35,10 +35,10 @@ def op1(f: Callable[[float], float], d: nd.NumDict[T]) -> nd.NumDict[T]:
 def op2(
     f: Callable[[float, float], float], d1: nd.NumDict[T], d2: nd.NumDict[T]
 ) -> nd.NumDict[T]:
-    keys = set(d1) | set(d2)
+    get1, c1, get2, c2 = d1._m.get, d1._c, d2._m.get, d2._c
     return nd.NumDict._new(
-        m={k: f(d1[k], d2[k]) for k in keys}, 
-        c=f(d1.c, d2.c))
+        m={k: f(get1(k, c1), get2(k, c2)) for k in d1.keys() | d2.keys()}, 
+        c=f(c1, c2))
 
 
 ### ABSTRACT AGGREGATION FUNCTIONS ###
@@ -69,11 +69,33 @@ def by(
     return nd.NumDict._new(m={k: f(v) for k, v in groups.items()})
 
 
+def by_max(d: nd.NumDict[T1], *, kf: Callable[[T1], T2]) -> nd.NumDict[T2]:
+    # Single pass equivalent of by(d, f=max, kf=kf); avoids building groups.
+    result: Dict[T2, float] = {}
+    get = result.get
+    for k, v in d._m.items():
+        k2 = kf(k)
+        u = get(k2)
+        if u is None or u < v: result[k2] = v
+    return nd.NumDict._new(m=result)
+
+
+def by_min(d: nd.NumDict[T1], *, kf: Callable[[T1], T2]) -> nd.NumDict[T2]:
+    # Single pass equivalent of by(d, f=min, kf=kf); avoids building groups.
+    result: Dict[T2, float] = {}
+    get = result.get
+    for k, v in d._m.items():
+        k2 = kf(k)
+        u = get(k2)
+        if u is None or v < u: result[k2] = v
+    return nd.NumDict._new(m=result)
+
+
 def eltwise(
     *ds: nd.NumDict[T], f: Callable[[Iterable[float]], float]
 ) -> nd.NumDict[T]:
     if len(ds) < 1: raise ValueError("At least one input is necessary.")
-    ks: Set[T] = set(); ks = ks.union(*ds)
+    ks: Set[T] = set(); ks = ks.union(*(d.keys() for d in ds))
     return nd.NumDict._new(
         m={k: f([d[k] for d in ds]) for k in ks}, 
         c=f([d.c for d in ds]))
@@ -5,7 +5,7 @@ from . import gradient_tape as gt
 
 from . import basic_ops as bops
 from . import dict_ops as dops 
-from .utils import reduce, by, eltwise
+from .utils import reduce, by, by_max, by_min, eltwise
 
 from itertools import product
 from typing import TypeVar, Tuple, Callable, overload, Any
@@ -227,7 +227,7 @@ def max_by(d: nd.NumDict[T1], *, kf: Callable[[T1], T2]) -> nd.NumDict[T2]:
     The resulting numdict contains a mapping of the following form. 
         {k_out: max(d[k] for k in d if kf(k) == k_out)}
     """
-    return by(d, f=max, kf=kf)
+    return by_max(d, kf=kf)
 
 @gt.GradientTape.grad(max_by)
 def _grad_max_by(
@@ -245,7 +245,7 @@ def min_by(d: nd.NumDict[T1], *, kf: Callable[[T1], T2]) -> nd.NumDict[T2]:
     The resulting numdict contains a mapping of the following form. 
         {k_out: min(d[k] for k in d if kf(k) == k_out)}
     """
-    return by(d, f=min, kf=kf)
+    return by_min(d, kf=kf)
 
 @gt.GradientTape.grad(min_by)
 def _grad_min_by(
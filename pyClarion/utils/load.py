@@ -4,7 +4,8 @@
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 import re
-from typing import Dict, List, Tuple, Iterable, Optional, Set, IO, Generator
+from typing import (Dict, List, Tuple, Iterable, Optional, Set, IO, Generator, 
+    Any, TypeVar)
 from collections import OrderedDict, ChainMap, deque
 from itertools import combinations
 
@@ -34,6 +35,9 @@ indent = r"'INDENT"
 dedent = r"'DEDENT"
 
 
+S = TypeVar("S")
+
+
 class CCMLError(RuntimeError):
     pass
 
@@ -239,6 +243,7 @@ class Context:
     for_index: List[str] = field(default_factory=list)
     var_id: str = ""
     lineno: List[str] = field(default_factory=list)
+    symbols: Dict[Any, Any] = field(default_factory=dict)
     _ref: str = r"{(?P<level>\*)?(?P<id>\w+)(?:#(?P<index>(?:\+|\-)?\d+))?}"
 
     @property
@@ -315,6 +320,10 @@ class Context:
         yield
         self.lineno.pop()
 
+    def intern(self, sym: S) -> S:
+        """Return the canonical instance of symbol sym."""
+        return self.symbols.setdefault(sym, sym)
+
     def gen_uri(self) -> str:
         assert self.load
         coords = "-".join([self.lineno[-1], *self.for_index])
@@ -399,7 +408,7 @@ class Interpreter:
             except ValueError: pass
         l = int(l) if l else 0
         w = float(w) if w != "" else None
-        f = feature(d, v, l)
+        f = ctx.intern(feature(d, v, l))
         if ctx.fspace is not None and f not in ctx.fspace:
             raise CCMLError(f"Line {tok.l}: {f} not a member of working "
                 "feature space")
@@ -431,7 +440,7 @@ class Interpreter:
         if noctx: fdata = fdata[ctx.fdelims[-1]:]
         for f, w in fdata:
             ctx.load.fs[(c, f)] = 1.0
-            dims.append(f.dim)
+            dims.append(ctx.intern(f.dim))
             if w is not None: 
                 if f.dim in ws:
                     raise CCMLError(f"Line {tok.l}: Ambiguous weight "
@@ -0,0 +1,63 @@
+import unittest
+import random
+
+from pyClarion import ActionRules, NumDict, chunk, rule
+from pyClarion.dev import first, second
+
+
+def reference(p, cr, rc, d, th, temp):
+    # Selection through NumDict ops, independent of ActionRules._select().
+    _d = d.keep_greater(ref=p.isolate(key=th))
+    if not (len(_d) and len(cr)):
+        return NumDict(), NumDict(), NumDict()
+    dist = (cr
+        .mul_from(_d, kf=first)
+        .boltzmann(p.isolate(key=temp))
+        .transform_keys(kf=second)
+        .squeeze())
+    r_sampled = rc.put(dist.sample().squeeze(), kf=first)
+    r_data = r_sampled.transform_keys(kf=first).squeeze()
+    action = r_sampled.mul(rc).transform_keys(kf=second).squeeze()
+    return action, r_data, dist
+
+
+class TestActionRules(unittest.TestCase):
+
+    def assertAlmostEqualDicts(self, d1, d2):
+        self.assertEqual(set(d1), set(d2))
+        for k in d1:
+            self.assertAlmostEqual(d1[k], d2[k], places=12)
+
+    def test_matches_op_chain(self):
+        # The op chain supports one condition and one conclusion per rule.
+        rng = random.Random(0)
+        for trial in range(30):
+            n_rules, n_chunks = rng.randint(1, 30), rng.randint(1, 30)
+            cr, rc = {}, {}
+            for i in range(n_rules):
+                r = rule(f"r{i}")
+                c = chunk(f"c{rng.randrange(n_chunks)}")
+                cr[(c, r)] = rng.choice([1.0, rng.random()])
+                rc[(r, chunk(f"a{i}"))] = rng.choice([1.0, rng.random()])
+            cr, rc = NumDict(cr, prot=True), NumDict(rc, prot=True)
+
+            proc = ActionRules()
+            proc.prefix = "fr"
+            th, temp = proc.params
+            for step in range(6):
+                p = NumDict({th: rng.choice([0.0, 0.2]),
+                    temp: rng.choice([1e-2, 0.1, 1.0])}, prot=True)
+                d = NumDict({chunk(f"c{c}"): rng.random()
+                    for c in range(n_chunks) if rng.random() < 0.5},
+                    prot=True)
+                seed = trial * 100 + step
+                random.seed(seed)
+                result = proc.call(p, cr, rc, d)
+                random.seed(seed)
+                expected = reference(p, cr, rc, d, th, temp)
+                for d1, d2 in zip(result, expected):
+                    self.assertAlmostEqualDicts(d1, d2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+import random
+
+from pyClarion import AssociativeRules, NumDict, chunk, rule
+from pyClarion.dev import first, second
+
+
+def make_rules(rng, n_rules=60, n_chunks=30):
+    cr, rc = {}, {}
+    for i in range(n_rules):
+        r = rule(f"r{i}")
+        for c in rng.sample(range(n_chunks), rng.randint(1, 4)):
+            cr[(chunk(f"c{c}"), r)] = rng.uniform(-1.0, 1.0)
+        for c in rng.sample(range(8), rng.randint(1, 2)):
+            rc[(r, chunk(f"k{c}"))] = rng.choice([1.0, rng.random()])
+    return NumDict(cr, prot=True), NumDict(rc, prot=True)
+
+
+def reference(cr, rc, d, epsilon=0.0):
+    # Propagation through NumDict ops, independent of the rule kernels.
+    norm = cr.put(cr.abs().sum_by(kf=first), kf=first).set_c(1)
+    s_r = (cr
+        .mul_from(d, kf=first, strict=True)
+        .div(norm)
+        .sum_by(kf=second)
+        .squeeze())
+    s_r = s_r.keep(sf=lambda r: epsilon < abs(s_r[r]))
+    s_c = (rc
+        .mul_from(s_r, kf=first, strict=True)
+        .max_by(kf=second)
+        .squeeze())
+    return s_c, s_r
+
+
+def perturb(rng, m, n_chunks, n_changes):
+    m = dict(m)
+    for _ in range(n_changes):
+        c = chunk(f"c{rng.randrange(n_chunks)}")
+        if c in m and rng.random() < 0.3:
+            del m[c]
+        else:
+            m[c] = rng.uniform(-1.0, 1.0)
+    return m
+
+
+class TestAssociativeRulesDelta(unittest.TestCase):
+
+    n_chunks = 30
+
+    def assertMatchesFull(self, p, cr, rc, d):
+        s_c, s_r = p.call(cr, rc, d)
+        ref_c, ref_r = AssociativeRules(epsilon=p.epsilon).call(cr, rc, d)
+        self.assertEqual(dict(s_c), dict(ref_c))
+        self.assertEqual(dict(s_r), dict(ref_r))
+        ref_c, ref_r = reference(cr, rc, d, p.epsilon)
+        self.assertAlmostEqualDicts(s_c, ref_c)
+        self.assertAlmostEqualDicts(s_r, ref_r)
+
+    def assertAlmostEqualDicts(self, d1, d2):
+        self.assertEqual(set(d1), set(d2))
+        for k in d1:
+            self.assertAlmostEqual(d1[k], d2[k], places=12)
+
+    def run_sequence(self, epsilon, n_changes, delta_limit=None, seed=0):
+        rng = random.Random(seed)
+        for _ in range(10):
+            cr, rc = make_rules(rng, n_chunks=self.n_chunks)
+            p = AssociativeRules(epsilon=epsilon)
+            if delta_limit is not None:
+                p._delta_limit = delta_limit
+            m = perturb(rng, {}, self.n_chunks, 10)
+            for step in range(8):
+                d = NumDict(m, prot=step % 3 != 2)
+                self.assertMatchesFull(p, cr, rc, d)
+                m = perturb(rng, m, self.n_chunks, n_changes)
+
+    def test_small_changes(self):
+        self.run_sequence(epsilon=0.0, n_changes=1)
+
+    def test_large_changes(self):
+        self.run_sequence(epsilon=0.0, n_changes=20)
+
+    def test_large_changes_forced_delta(self):
+        self.run_sequence(epsilon=0.0, n_changes=20, delta_limit=1.0)
+
+    def test_epsilon_small_changes(self):
+        self.run_sequence(epsilon=0.2, n_changes=1, seed=1)
+
+    def test_epsilon_forced_delta(self):
+        self.run_sequence(epsilon=0.2, n_changes=20, delta_limit=1.0, seed=1)
+
+    def test_conditions_removed(self):
+        rng = random.Random(2)
+        cr, rc = make_rules(rng, n_chunks=self.n_chunks)
+        p = AssociativeRules()
+        p._delta_limit = 1.0
+        m = {chunk(f"c{c}"): rng.uniform(-1.0, 1.0)
+            for c in range(self.n_chunks)}
+        while m:
+            self.assertMatchesFull(p, cr, rc, NumDict(m, prot=True))
+            del m[next(iter(m))]
+        self.assertMatchesFull(p, cr, rc, NumDict(prot=True))
+
+    def test_delta_limit_selects_path(self):
+        rng = random.Random(3)
+        cr, rc = make_rules(rng, n_rules=200, n_chunks=100)
+        p = AssociativeRules()
+        m = perturb(rng, {}, 100, 20)
+        p.call(cr, rc, NumDict(m, prot=True))
+        strengths = p._state.strengths
+
+        # Changing one condition stays under the limit: state is patched.
+        c = next(iter(m))
+        m[c] = m[c] + 1.0
+        self.assertMatchesFull(p, cr, rc, NumDict(m, prot=True))
+        self.assertIs(p._state.strengths, strengths)
+
+        # Changing every condition exceeds it: state is rebuilt.
+        m = {k: v + 1.0 for k, v in m.items()}
+        self.assertMatchesFull(p, cr, rc, NumDict(m, prot=True))
+        self.assertIsNot(p._state.strengths, strengths)
+
+    def test_epsilon_read_only(self):
+        p = AssociativeRules(epsilon=0.3)
+        with self.assertRaises(AttributeError):
+            p.epsilon = 0.0 # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from pyClarion import Module, Structure, NumDict, feature
+from pyClarion.base import Process
+
+
+class Source(Process):
+    initial = NumDict()
+
+    def __init__(self) -> None:
+        self.data = NumDict()
+
+    def call(self) -> NumDict:
+        return self.data
+
+
+class Counter(Process):
+    initial = NumDict()
+    memoize = True
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def call(self, d: NumDict) -> NumDict:
+        self.calls += 1
+        return NumDict(d)
+
+
+class TestModuleMemo(unittest.TestCase):
+
+    def setUp(self) -> None:
+        with Structure("s") as self.s:
+            self.src = Module("src", Source())
+            self.mod = Module("mod", Counter(), ["src"])
+
+    def test_skips_identical_inputs(self):
+        self.s.step()
+        self.s.step()
+        self.assertEqual(self.mod.process.calls, 1)
+
+    def test_calls_on_new_inputs(self):
+        self.s.step()
+        self.src.process.data = NumDict({feature("x"): 1.0})
+        self.s.step()
+        self.assertEqual(self.mod.process.calls, 2)
+        self.assertEqual(self.mod.output, NumDict({feature("x"): 1.0}))
+
+    def test_reset_on_output_set(self):
+        self.s.step()
+        self.mod.clear_output()
+        self.s.step()
+        self.assertEqual(self.mod.process.calls, 2)
+
+    def test_calls_on_unprotected_inputs(self):
+        self.s.step()
+        self.src.output.prot = False
+        self.mod.step()
+        self.assertEqual(self.mod.process.calls, 2)
+
+    def test_reset_on_process_set(self):
+        self.s.step()
+        self.mod.process = Counter()
+        self.s.step()
+        self.assertEqual(self.mod.process.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from pyClarion import Store, NumDict, chunk
+
+
+class TestStoreOutputs(unittest.TestCase):
+
+    def call(self, s):
+        return s.call(NumDict(), NumDict(), NumDict(), NumDict())
+
+    def test_outputs_stable_across_calls(self):
+        s = Store()
+        s.wn = NumDict({chunk("a"): 2.0})
+        first, second = self.call(s), self.call(s)
+        for d1, d2 in zip(first, second):
+            self.assertIs(d1, d2)
+
+    def test_wn_rebuilt_on_reassignment(self):
+        s = Store(g=lambda d: d * 2)
+        s.wn = NumDict({chunk("a"): 2.0})
+        wn = self.call(s)[2]
+        s.wn = NumDict({chunk("a"): 3.0})
+        new = self.call(s)[2]
+        self.assertIsNot(new, wn)
+        self.assertEqual(new, NumDict({chunk("a"): 6.0}))
+
+    def test_wn_protected_once_read(self):
+        s = Store()
+        s.wn = NumDict({chunk("a"): 2.0})
+        self.call(s)
+        with self.assertRaises(RuntimeError):
+            s.wn[chunk("a")] = 1.0
+
+
+if __name__ == "__main__":
+    unittest.main()